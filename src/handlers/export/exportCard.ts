@@ -262,9 +262,7 @@ export async function exportCard(
 
     try {
       // Ensure export directory exists
-      if (!fs.existsSync(exportDirectory)) {
-        fs.mkdirSync(exportDirectory, { recursive: true });
-      }
+      fs.mkdirSync(exportDirectory, { recursive: true });
 
       // Write the file based on format and calculate file size
       if (format === 'json') {
@@ -266,9 +266,7 @@ export async function exportSqlQuery(
 
     try {
       // Ensure export directory exists
-      if (!fs.existsSync(exportDirectory)) {
-        fs.mkdirSync(exportDirectory, { recursive: true });
-      }
+      fs.mkdirSync(exportDirectory, { recursive: true });
 
       // Write the file based on format and calculate file size
       if (format === 'json') {
@@ -57,9 +57,7 @@ export function saveRawStructure(model: string, rawData: any, enableSave: boolea
     };
 
     // Ensure directory exists
-    if (!fs.existsSync(docsDir)) {
-      fs.mkdirSync(docsDir, { recursive: true });
-    }
+    fs.mkdirSync(docsDir, { recursive: true });
 
     fs.writeFileSync(filePath, JSON.stringify(referenceDoc, null, 2));
     // Debug: Saved raw structure for analysis